@@ -7,15 +7,18 @@
 
 """CLI application for various cryptographic operations."""
 
+import base64
+import binascii
 import copy
+import functools
 import hashlib
+import hmac
 import logging
 import os
 import sys
-from typing import Dict, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Type, Union
 
 import click
-from Crypto.PublicKey import ECC, RSA
 
 from spsdk import SPSDKError
 from spsdk.apps.nxpcertgen import main as cert_gen_main
@@ -28,6 +31,41 @@ from spsdk.apps.utils.common_cli_options import (
 from spsdk.apps.utils.utils import SPSDKAppError, catch_spsdk_error
 from spsdk.utils.misc import load_binary, write_file
 
+if TYPE_CHECKING:
+    # Crypto will be loaded lazily as needed, this is just to satisfy type-hint checkers
+    from Crypto.PublicKey import ECC, RSA
+
+# size of chunks used while streaming a file into the hash function
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# only the first line of a file with reference digest is used
+DIGEST_COMPARE_READ_SIZE = 4096
+
+# sorted to keep the order of choices in help stable
+HASH_ALGORITHMS = tuple(sorted(hashlib.algorithms_available))
+
+# direct constructors of the common hashes, others are created by name
+HASH_CONSTRUCTORS: Dict[str, Callable[[], "hashlib._Hash"]] = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha224": hashlib.sha224,
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+    "sha3_256": hashlib.sha3_256,
+    "sha3_384": hashlib.sha3_384,
+    "sha3_512": hashlib.sha3_512,
+}
+
+# DER encoded ANSI X9.62 OID arc (1.2.840.10045) shared by EC key type and curve identifiers
+_ECC_OID_ARC = b"\x2a\x86\x48\xce\x3d"
+
+RAW_PRIVATE_KEY_MAX_LENGTH = 48
+RAW_PUBLIC_KEY_LENGTHS = (64, 96)
+
+# exact lengths of raw private (32, 48) and public (64, 96) keys
+_CURVE_NAME_BY_KEY_LENGTH = {32: "p256", 48: "p384", 64: "p256", 96: "p384"}
+
 
 @click.group(name="nxpcrypto", no_args_is_help=True, cls=CommandsTreeGroup)
 @spsdk_apps_common_options
@@ -42,7 +80,7 @@ def main(log_level: int) -> None:
     "--hash",
     "hash_name",
     required=True,
-    type=click.Choice(list(hashlib.algorithms_available), case_sensitive=False),
+    type=click.Choice(HASH_ALGORITHMS, case_sensitive=False),
     help="Name of a hash to use.",
 )
 @click.option(
@@ -60,25 +98,34 @@ def main(log_level: int) -> None:
 )
 def digest(hash_name: str, infile: str, compare: str) -> None:
     """Computes digest/hash of the given file."""
-    data = load_binary(infile)
-    hasher = hashlib.new(hash_name.lower())
-    hasher.update(data)
+    hash_constructor = HASH_CONSTRUCTORS.get(hash_name.lower()) or functools.partial(
+        hashlib.new, hash_name.lower()
+    )
+    with open(infile, "rb") as f:
+        # file_digest (Python 3.11+) hashes the file in C with GIL released
+        if hasattr(hashlib, "file_digest"):
+            hasher = hashlib.file_digest(f, hash_constructor)
+        else:
+            hasher = hash_constructor()
+            while chunk := f.read(DIGEST_CHUNK_SIZE):
+                hasher.update(chunk)
     hexdigest = hasher.hexdigest()
     click.echo(f"{hash_name.upper()}({infile})= {hexdigest}")
     if compare:
         # assume comparing to a file
         if os.path.isfile(compare):
-            with open(compare) as f:
-                compare_data = f.readline().strip()
-                # assume format generated by openssl
-                if "=" in compare_data:
-                    ref = compare_data.split("=")[-1].strip()
-                # assume hash is on the fist line
-                else:
-                    ref = compare_data
+            with open(compare, "rb") as f:
+                compare_data = f.read(DIGEST_COMPARE_READ_SIZE).split(b"\n", 1)[0]
+            # assume format generated by openssl, otherwise hash is on the first line
+            ref = compare_data.rsplit(b"=", 1)[-1].strip().decode("ascii", errors="replace")
         else:
             ref = compare
-        if ref.lower() == hexdigest.lower():
+        try:
+            digests_match = hmac.compare_digest(bytes.fromhex(ref), hasher.digest())
+        except ValueError:
+            # reference is not a valid hex string
+            digests_match = False
+        if digests_match:
             click.echo("Digests are the same.")
         else:
             raise SPSDKAppError("Digests differ!")
@@ -99,7 +146,8 @@ def key_group() -> None:
     """Group of commands for working with asymmetric keys."""
 
 
-key_gen_copy = copy.deepcopy(key_gen_main)
+# shallow copy is enough, only the name differs; options and callback are shared
+key_gen_copy = copy.copy(key_gen_main)
 key_gen_copy.name = "generate"
 key_group.add_command(key_gen_copy)
 
@@ -139,6 +187,9 @@ key_group.add_command(key_gen_copy)
 )
 def convert(output_format: str, infile: str, outfile: str, puk: bool, use_pkcs8: bool) -> None:
     """Convert Asymmetric key into various formats."""
+    # import Crypto only if needed to save startup time
+    from Crypto.PublicKey import ECC, RSA  # pylint: disable=import-outside-toplevel
+
     key_data = load_binary(infile)
     key = reconstruct_key(key_data=key_data)
     if puk:
@@ -149,21 +200,23 @@ def convert(output_format: str, infile: str, outfile: str, puk: bool, use_pkcs8:
             "format": output_format.upper(),
         }
         if key.has_private():
-            if isinstance(key, ECC.EccKey):
-                params["use_pkcs8"] = use_pkcs8
-            if isinstance(key, RSA.RsaKey):
-                params["pkcs"] = 8 if use_pkcs8 else 1
+            private_key_params: Dict[Type, Dict[str, Union[int, bool]]] = {
+                ECC.EccKey: {"use_pkcs8": use_pkcs8},
+                RSA.RsaKey: {"pkcs": 8 if use_pkcs8 else 1},
+            }
+            params.update(private_key_params[type(key)])
         tmp_data = key.export_key(**params)  # type: ignore  # yeah, MyPy doesn't like dict unpacking
         out_data = tmp_data.encode("utf-8") if isinstance(tmp_data, str) else tmp_data
     if output_format.upper() == "RAW":
         if not isinstance(key, ECC.EccKey):
             raise SPSDKError("Converting to RAW is supported only for ECC keys")
-        key_size = key.pointQ.size_in_bytes()
+        point = key.pointQ
+        key_size = point.size_in_bytes()
         if key.has_private():
             out_data = key.d.to_bytes(key_size)  # type: ignore  # this `to_bytes` doesn't have byteorder
         else:
-            x = key.pointQ.x.to_bytes(key_size)  # type: ignore  # this `to_bytes` doesn't have byteorder
-            y = key.pointQ.y.to_bytes(key_size)  # type: ignore  # this `to_bytes` doesn't have byteorder
+            x = point.x.to_bytes(key_size)  # type: ignore  # this `to_bytes` doesn't have byteorder
+            y = point.y.to_bytes(key_size)  # type: ignore  # this `to_bytes` doesn't have byteorder
             out_data = x + y
 
     write_file(out_data, outfile, mode="wb")
@@ -174,6 +227,8 @@ def convert(output_format: str, infile: str, outfile: str, puk: bool, use_pkcs8:
 @click.argument("key2", type=click.Path(exists=True, dir_okay=False))
 def check_keys(key1: str, key2: str) -> None:
     """Check whether provided keys form a key pair or represent the same key."""
+    from Crypto.PublicKey import ECC  # pylint: disable=import-outside-toplevel
+
     key1_data = load_binary(key1)
     key2_data = load_binary(key2)
     first = reconstruct_key(key1_data)
@@ -190,40 +245,76 @@ def check_keys(key1: str, key2: str) -> None:
 
 def get_curve_name(key_length: int) -> str:
     """Get curve name for Crypto library."""
-    if key_length <= 32:
+    curve_name = _CURVE_NAME_BY_KEY_LENGTH.get(key_length)
+    if curve_name:
+        return curve_name
+    if key_length < 32:
         return "p256"
-    if key_length <= 48:
+    if key_length < 48:
         return "p384"
-    if key_length in [64, 96]:
-        return f"p{key_length * 4}"
     raise SPSDKError(f"Not sure what curve corresponds to {key_length} data")
 
 
+def _is_raw_key_length(key_length: int) -> bool:
+    """Check whether data of given length might be a raw ECC key."""
+    return key_length <= RAW_PRIVATE_KEY_MAX_LENGTH or key_length in RAW_PUBLIC_KEY_LENGTHS
+
+
+def _is_ecc_key(key_data: bytes) -> bool:
+    """Guess whether PEM or DER encoded key is an ECC key.
+
+    :param key_data: PEM or DER encoded key
+    :return: True if the key contains identifier from the ANSI X9.62 (EC) arc
+    """
+    if key_data.startswith(b"-----"):
+        header = key_data.split(b"\n", 1)[0]
+        if b"EC " in header:
+            return True
+        if b"RSA " in header:
+            return False
+        body = b"".join(line for line in key_data.splitlines() if not line.startswith(b"-----"))
+        try:
+            key_data = base64.b64decode(body)
+        except binascii.Error:
+            return False
+    return _ECC_OID_ARC in key_data
+
+
 # we use Crypto instead of cryptography because of binary private key reconstruction
-def reconstruct_key(key_data: bytes) -> Union[ECC.EccKey, RSA.RsaKey]:
+def reconstruct_key(key_data: bytes) -> Union["ECC.EccKey", "RSA.RsaKey"]:
     """Reconstruct Crypto key from PEM,DER or RAW data."""
-    try:
-        return RSA.import_key(key_data)
-    except (ValueError, TypeError):
-        pass
-    try:
-        return ECC.import_key(key_data)
-    except ValueError:
-        pass
-    # attempt to reconstruct key from raw data
+    from Crypto.PublicKey import ECC, RSA  # pylint: disable=import-outside-toplevel
+
     key_length = len(key_data)
+    # PEM and DER (ASN.1 SEQUENCE) keys are recognized by the leading bytes,
+    # other data not having size of a raw key may be in format supported by Crypto (e.g. OpenSSH)
+    if key_data.startswith((b"-----", b"\x30")) or not _is_raw_key_length(key_length):
+        # start with the more likely key type to avoid a failing import
+        importers: List[Callable[[bytes], Union[ECC.EccKey, RSA.RsaKey]]] = [
+            RSA.import_key,
+            ECC.import_key,
+        ]
+        if _is_ecc_key(key_data):
+            importers.reverse()
+        for import_key in importers:
+            try:
+                return import_key(key_data)
+            except (ValueError, TypeError):
+                pass
+    # attempt to reconstruct key from raw data
     curve = get_curve_name(key_length)
     # everything under 49 bytes is a private key
-    if key_length <= 48:
+    if key_length <= RAW_PRIVATE_KEY_MAX_LENGTH:
         # pylint: disable=invalid-name   # 'd' is regular name for private key number
         d = int.from_bytes(key_data, byteorder="big")
         return ECC.construct(curve=curve, d=d)
     # public keys in binary form have exact sizes
-    if key_length in [64, 96]:
+    if key_length in RAW_PUBLIC_KEY_LENGTHS:
         coord_length = key_length // 2
         x = int.from_bytes(key_data[:coord_length], byteorder="big")
         y = int.from_bytes(key_data[coord_length:], byteorder="big")
-        return ECC.construct(curve=curve, point_x=x, point_y=y)
+        # build the key from the point directly; EccPoint still checks the point is on the curve
+        return ECC.EccKey(curve=curve, point=ECC.EccPoint(x, y, curve=curve))
     raise SPSDKError(f"Can't recognize key with length {key_length}")
 
 
@@ -7,16 +7,21 @@
 
 """Module with Debug Authentication Response (DAR) Packet."""
 
-from struct import pack
-from typing import Type
+import concurrent.futures
+import os
+from operator import methodcaller
+from struct import Struct
+from typing import List, Optional, Sequence, Type
 
 from spsdk import SPSDKError, crypto
-from spsdk.crypto import rsa
 from spsdk.crypto.signature_provider import PlainFileSP
 from spsdk.dat import DebugAuthenticationChallenge
 from spsdk.dat.debug_credential import DebugCredential
-from spsdk.dat.utils import ecc_public_numbers_to_bytes
-from spsdk.utils.crypto.backend_internal import internal_backend
+from spsdk.dat.utils import ecc_signature_to_bytes
+
+# precompiled layouts of the fields following the debug credential
+_BEACON_STRUCT = Struct("<L")
+_BEACON_UUID_STRUCT = Struct("<L16s")
 
 
 class DebugAuthenticateResponse:
@@ -49,16 +54,14 @@ class DebugAuthenticateResponse:
         msg += f"Authentication Beacon: {self.auth_beacon}\n"
         return msg
 
-    def _get_data_for_signature(self) -> bytes:
+    def _get_data_for_signature(self, common_data: bytes) -> bytes:
         """Collects the data for signature in bytes format."""
-        data = self._get_common_data()
-        data += self.dac.challenge
-        return data
+        return b"".join((common_data, self.dac.challenge))
 
-    def _get_signature(self) -> bytes:
+    def _get_signature(self, common_data: bytes) -> bytes:
         if not self.sig_provider:
             raise SPSDKError("Signature provider is not set")
-        signature = self.sig_provider.sign(self._get_data_for_signature())
+        signature = self.sig_provider.sign(self._get_data_for_signature(common_data))
         if not signature:
             raise SPSDKError("Signature is not present")
         return signature
@@ -68,15 +71,12 @@ class DebugAuthenticateResponse:
 
         :return: the exported bytes from object
         """
-        data = self._get_common_data()
-        data += self._get_signature()
-        return data
+        common = self._collect_common_data()
+        return b"".join((common, self._get_signature(common)))
 
-    def _get_common_data(self) -> bytes:
+    def _collect_common_data(self) -> bytes:
         """Collects dc, auth_beacon."""
-        data = self.debug_credential.export()
-        data += pack("<L", self.auth_beacon)
-        return data
+        return b"".join((self.debug_credential.export(), _BEACON_STRUCT.pack(self.auth_beacon)))
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "DebugAuthenticateResponse":
@@ -121,21 +121,11 @@ class DebugAuthenticateResponse:
 
 
 class DebugAuthenticateResponseRSA(DebugAuthenticateResponse):
-    """Class for RSA specifics of DAR packet."""
-
-    def _get_signature(self) -> bytes:
-        """Create signature for RSA.
+    """Class for RSA specifics of DAR packet.
 
-        :return: signature in bytes format
-        """
-        key = crypto.load_private_key(file_path=self.dck_priv)
-        assert isinstance(key, rsa.RSAPrivateKey)
-        key_bytes = key.private_bytes(
-            encoding=crypto.Encoding.PEM,
-            format=crypto.serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=crypto.serialization.NoEncryption(),
-        )
-        return internal_backend.rsa_sign(key_bytes, self._get_data_for_signature())
+    The RSA signature (PKCS#1 v1.5, SHA-256) is created by the signature provider,
+    which loads the DCK private key just once.
+    """
 
 
 class DebugAuthenticateResponseECC(DebugAuthenticateResponse):
@@ -144,19 +134,18 @@ class DebugAuthenticateResponseECC(DebugAuthenticateResponse):
     KEY_LENGTH = 0
     CURVE: crypto.ec.EllipticCurve = crypto.ec.SECP256R1()
 
-    def _get_signature(self) -> bytes:
+    def _get_signature(self, common_data: bytes) -> bytes:
         """Sign the DAR data using SignatureProvider."""
-        signature = super()._get_signature()
-        r, s = crypto.utils_cryptography.decode_dss_signature(signature)
-        public_numbers = crypto.EllipticCurvePublicNumbers(r, s, self.CURVE)
-        return ecc_public_numbers_to_bytes(public_numbers=public_numbers, length=self.KEY_LENGTH)
+        return ecc_signature_to_bytes(super()._get_signature(common_data), length=self.KEY_LENGTH)
 
-    def _get_common_data(self) -> bytes:
+    def _collect_common_data(self) -> bytes:
         """Collects dc, auth_beacon and UUID."""
-        data = self.debug_credential.export()
-        data += pack("<L", self.auth_beacon)
-        data += pack("<16s", self.dac.uuid)
-        return data
+        return b"".join(
+            (
+                self.debug_credential.export(),
+                _BEACON_UUID_STRUCT.pack(self.auth_beacon, self.dac.uuid),
+            )
+        )
 
 
 class DebugAuthenticateResponseECC_256(DebugAuthenticateResponseECC):
@@ -180,6 +169,23 @@ class DebugAuthenticateResponseECC_521(DebugAuthenticateResponseECC):
     CURVE = crypto.ec.SECP521R1()
 
 
+def export_many(
+    dars: Sequence[DebugAuthenticateResponse], max_workers: Optional[int] = None
+) -> List[bytes]:
+    """Export multiple DAR packets, signing them in parallel threads on multi-core hosts.
+
+    :param dars: DAR objects to export
+    :param max_workers: maximal count of threads, defaults to the count of CPUs (at most one per DAR)
+    :return: list of exported DAR packets in the order of input objects
+    """
+    if max_workers is None:
+        max_workers = min(len(dars), os.cpu_count() or 1)
+    if len(dars) < 2 or max_workers == 1:
+        return [dar.export() for dar in dars]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(methodcaller("export"), dars))
+
+
 _version_mapping = {
     "1.0": DebugAuthenticateResponseRSA,
     "1.1": DebugAuthenticateResponseRSA,
@@ -14,7 +14,7 @@ from typing import Any, List, Optional, Type
 from spsdk import SPSDKError, crypto
 from spsdk.crypto.loaders import extract_public_key
 from spsdk.crypto.signature_provider import SignatureProvider, get_signature_provider
-from spsdk.dat.utils import ecc_key_to_bytes, ecc_public_numbers_to_bytes, rsa_key_to_bytes
+from spsdk.dat.utils import ecc_key_to_bytes, ecc_signature_to_bytes, rsa_key_to_bytes
 from spsdk.exceptions import SPSDKValueError
 from spsdk.image.ahab.ahab_container import SRKRecord, SRKTable
 from spsdk.utils.crypto.backend_internal import internal_backend
@@ -331,11 +331,7 @@ class DebugCredentialECC(DebugCredential):
         super().sign()
         if not self.signature:
             raise SPSDKError("Debug Credential Signature is not set in base class")
-        r, s = crypto.utils_cryptography.decode_dss_signature(self.signature)
-        public_numbers = crypto.EllipticCurvePublicNumbers(r, s, self.CURVE)
-        self.signature = ecc_public_numbers_to_bytes(
-            public_numbers=public_numbers, length=self.CORD_LENGTH
-        )
+        self.signature = ecc_signature_to_bytes(self.signature, length=self.CORD_LENGTH)
 
     @classmethod
     def _get_rot_meta(cls, used_root_cert: int, rot_pub_keys: List[str]) -> bytes:
@@ -29,6 +29,17 @@ def reconstruct_signature(signature_bytes: bytes, size: Optional[int] = None) ->
     return signature
 
 
+def ecc_signature_to_bytes(signature: bytes, length: int) -> bytes:
+    """Converts DER encoded ECDSA signature into raw r and s bytes.
+
+    :param signature: DER encoded signature
+    :param length: length of r and s bytes
+    :return: concatenated r and s bytes
+    """
+    r, s = utils_cryptography.decode_dss_signature(signature)
+    return r.to_bytes(length, "big") + s.to_bytes(length, "big")
+
+
 def ecc_public_numbers_to_bytes(
     public_numbers: crypto.EllipticCurvePublicNumbers, length: Optional[int] = None
 ) -> bytes:
@@ -7,28 +7,22 @@
 """Contains support for BEE encryption for RT10xx devices."""
 
 
+import concurrent.futures
+import functools
 import logging
 import os
-from struct import calcsize, pack, unpack_from
-from typing import Any, Dict, List, Optional, Sequence
+from struct import Struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from Crypto.Cipher import AES
 
 from spsdk import SPSDKError
 from spsdk.exceptions import SPSDKOverlapError
 from spsdk.utils import UTILS_DATA_FOLDER
-from spsdk.utils.crypto import Counter, crypto_backend
+from spsdk.utils.crypto import crypto_backend
 from spsdk.utils.database import Database
 from spsdk.utils.easy_enum import Enum
-from spsdk.utils.misc import (
-    DebugInfo,
-    align_block_fill_random,
-    extend_block,
-    load_binary,
-    split_data,
-    value_to_bytes,
-    value_to_int,
-)
+from spsdk.utils.misc import DebugInfo, extend_block, load_binary, value_to_bytes, value_to_int
 from spsdk.utils.schema_validator import ConfigTemplate, ValidationSchemas
 
 logger = logging.getLogger(__name__)
@@ -42,14 +36,35 @@ BEE_DATABASE_FILE: str = os.path.join(BEE_DATA_FOLDER, "database.yaml")
 BEE_ENCR_BLOCK_SIZE = 0x400
 # mask of the bits in the address, that must be zero
 _ENCR_BLOCK_ADDR_MASK = BEE_ENCR_BLOCK_SIZE - 1  # 0x3FF
+# minimal total size of the encrypted runs in bytes to encrypt them in a thread pool
+_PARALLEL_ENCR_MIN_SIZE = 0x100000
+
+
+@functools.lru_cache(maxsize=1)
+def _get_database() -> Database:
+    """Returns BEE database; the database file is loaded just on the first use.
+
+    :return: BEE database
+    """
+    return Database(BEE_DATABASE_FILE)
 
 
 class BeeBaseClass:
     """BEE base class."""
 
+    # no instance fields in the base class; allows child classes to use __slots__
+    __slots__ = ()
+
     # format of the binary representation of the class, used as parameter for struct.pack/unpack methods
     # the format is class specific, and must be defined in child class
     _FORMAT = "@_must_be_defined_in_child_class_@"
+    # precompiled `_FORMAT`, created automatically for each child class defining the format
+    _STRUCT: Struct
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "_FORMAT" in vars(cls):
+            cls._STRUCT = Struct(cls._FORMAT)
 
     @classmethod
     def _struct_format(cls) -> str:
@@ -59,7 +74,7 @@ class BeeBaseClass:
     @classmethod
     def _size(cls) -> int:
         """:return: size of the exported binary data in bytes."""
-        return calcsize(cls._struct_format())
+        return cls._STRUCT.size
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, self.__class__) and (vars(other) == vars(self))
@@ -109,8 +124,13 @@ class BeeBaseClass:
 class BeeFacRegion(BeeBaseClass):
     """BEE Factory Access Control (FAC) region."""
 
+    __slots__ = ("start_addr", "length", "protected_level")
+
     # format of the binary representation of the class, used as parameter for struct.pack/unpack methods
-    _FORMAT = "<3I20s"
+    # reserved area at the end is zero-filled padding
+    _FORMAT = "<3I20x"
+    # size of the reserved area
+    _RESERVED_SIZE = 20
 
     def __init__(self, start: int = 0, length: int = 0, protected_level: int = 0):
         """Constructor.
@@ -128,6 +148,14 @@ class BeeFacRegion(BeeBaseClass):
     def __str__(self) -> str:
         return f"FAC: 0x{self.start_addr:08x}[0x{self.length:x}]"
 
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, self.__class__)
+            and self.start_addr == other.start_addr
+            and self.length == other.length
+            and self.protected_level == other.protected_level
+        )
+
     @property
     def end_addr(self) -> int:
         """:return: end address of the region (which is last address of the region + 1)."""
@@ -139,9 +167,7 @@ class BeeFacRegion(BeeBaseClass):
 
     def validate(self) -> None:
         """Validates the configuration of the instance."""
-        if (self.start_addr & _ENCR_BLOCK_ADDR_MASK != 0) and (
-            self.length & _ENCR_BLOCK_ADDR_MASK != 0
-        ):
+        if (self.start_addr | self.length) & _ENCR_BLOCK_ADDR_MASK:
             raise SPSDKError("Invalid configuration of the instance")
         if self.protected_level < 0 or self.protected_level > 3:
             raise SPSDKError("Invalid protected level")
@@ -151,12 +177,10 @@ class BeeFacRegion(BeeBaseClass):
     def export(self) -> bytes:
         """Exports the binary representation."""
         result = super().export()
-        return result + pack(
-            self._struct_format(),
+        return result + self._STRUCT.pack(
             self.start_addr,
             self.end_addr,
             self.protected_level,
-            b"\x00" * 20,
         )
 
     @classmethod
@@ -169,10 +193,9 @@ class BeeFacRegion(BeeBaseClass):
         :raises SPSDKError: If reserved area is non-zero
         """
         super().parse(data, offset)  # check size of the data
-        (start, end, protected_level, _reserved) = unpack_from(
-            BeeFacRegion._struct_format(), data, offset
-        )
-        if _reserved != b"\x00" * 20:
+        (start, end, protected_level) = BeeFacRegion._STRUCT.unpack_from(data, offset)
+        reserved_end = offset + BeeFacRegion._STRUCT.size
+        if data[reserved_end - cls._RESERVED_SIZE : reserved_end] != bytes(cls._RESERVED_SIZE):
             raise SPSDKError("Reserved area is non-zero")
         return BeeFacRegion(start, end - start, protected_level)
 
@@ -188,7 +211,10 @@ class BeeProtectRegionBlock(BeeBaseClass):
     """BEE protect region block (PRDB)."""
 
     # format of the binary representation of the class, used as parameter for struct.pack/unpack methods
-    _FORMAT = "<8I16s32s"
+    # reserved area at the end is zero-filled padding
+    _FORMAT = "<8I16s32x"
+    # size of the reserved area
+    _RESERVED_SIZE = 32
     # low TAG used in the header
     TAGL = 0x5F474154  # "TAG_"
     # high TAG used in the header
@@ -222,13 +248,22 @@ class BeeProtectRegionBlock(BeeBaseClass):
         self._end_addr = 0xFFFFFFFF  # this is calculated automatically based on FAC regions
         self.mode = encr_mode
         self.lock_options = lock_options
-        self.counter = (
-            counter if counter else crypto_backend().random_bytes(12) + b"\x00\x00\x00\x00"
-        )
+        self.counter = counter if counter else crypto_backend().random_bytes(12) + bytes(4)
 
         # - FAC regions, 1 - 4
         self.fac_regions: List[BeeFacRegion] = []
 
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, self.__class__)
+            and self._start_addr == other._start_addr
+            and self._end_addr == other._end_addr
+            and self.mode == other.mode
+            and self.lock_options == other.lock_options
+            and self.counter == other.counter
+            and self.fac_regions == other.fac_regions
+        )
+
     def update(self) -> None:
         """Updates start and end address of the encryption region."""
         super().update()
@@ -275,7 +310,7 @@ class BeeProtectRegionBlock(BeeBaseClass):
             raise SPSDKError("Only AES/CTR encryption mode supported now")
         if len(self.counter) != 16:
             raise SPSDKError("Invalid counter")
-        if self.counter[-4:] != b"\x00\x00\x00\x00":
+        if self.counter[-4:] != bytes(4):
             raise SPSDKError("last four bytes must be zero")
         if self.fac_count <= 0 or self.fac_count > self.FAC_REGIONS:
             raise SPSDKError("Invalid FAC regions")
@@ -285,8 +320,7 @@ class BeeProtectRegionBlock(BeeBaseClass):
     def export(self) -> bytes:
         """:return: binary representation of the region (serialization)."""
         result = super().export()
-        result += pack(
-            self._struct_format(),
+        result += self._STRUCT.pack(
             self.TAGL,
             self.TAGH,
             self.VERSION,
@@ -296,7 +330,6 @@ class BeeProtectRegionBlock(BeeBaseClass):
             self.mode,
             self.lock_options,
             self.counter[::-1],  # bytes swapped: reversed order
-            b"\x00" * 32,
         )
         for fac in self.fac_regions:
             result += fac.export()
@@ -323,20 +356,20 @@ class BeeProtectRegionBlock(BeeBaseClass):
             mode,
             lock_options,
             counter,
-            _reserved_32,
-        ) = unpack_from(BeeProtectRegionBlock._struct_format(), data, offset)
+        ) = BeeProtectRegionBlock._STRUCT.unpack_from(data, offset)
         #
         if (tagl != BeeProtectRegionBlock.TAGL) or (tagh != BeeProtectRegionBlock.TAGH):
             raise SPSDKError("Invalid tag or unsupported version")
         if version != BeeProtectRegionBlock.VERSION:
             raise SPSDKError("Unsupported version")
-        if _reserved_32 != b"\x00" * 32:
+        reserved_end = offset + BeeProtectRegionBlock._STRUCT.size
+        if data[reserved_end - cls._RESERVED_SIZE : reserved_end] != bytes(cls._RESERVED_SIZE):
             raise SPSDKError("Reserved area is non-zero")
         #
         result = BeeProtectRegionBlock(mode, lock_options, counter[::-1])
         result._start_addr = start_addr
         result._end_addr = end_addr
-        offset += calcsize(BeeProtectRegionBlock._struct_format())
+        offset += BeeProtectRegionBlock._STRUCT.size
         for _ in range(fac_count):
             fac = BeeFacRegion.parse(data, offset)
             result.add_fac(fac)
@@ -351,6 +384,26 @@ class BeeProtectRegionBlock(BeeBaseClass):
         """
         return self._start_addr <= start_addr < self._end_addr
 
+    def is_overlapping(self, start_addr: int, length: int) -> bool:
+        """Returns true if the data overlaps the region of the FAC regions.
+
+        :param start_addr: start address of the data
+        :param length: length of the data
+        """
+        return self._start_addr < start_addr + length and start_addr < self._end_addr
+
+    def get_fac_region(self, start_addr: int) -> Optional[BeeFacRegion]:
+        """Returns FAC region the start address lies in.
+
+        :param start_addr: start address of the data
+        :return: first FAC region containing the address; None if the address is not in any FAC region
+        """
+        if self.is_inside_region(start_addr):
+            for fac in self.fac_regions:
+                if fac.start_addr <= start_addr < fac.end_addr:
+                    return fac
+        return None
+
     def encrypt_block(self, key: bytes, start_addr: int, data: bytes) -> bytes:
         """Encrypt block located in any FAC region.
 
@@ -359,33 +412,117 @@ class BeeProtectRegionBlock(BeeBaseClass):
         :param data: binary block to be encrypted; the block size must be BEE_ENCR_BLOCK_SIZE
         :return: encrypted block if it is inside any FAC region; untouched block if it is not in any FAC region
         :raises SPSDKError: When incorrect length of binary block
+        """
+        if len(data) > BEE_ENCR_BLOCK_SIZE:
+            raise SPSDKError("Incorrect length of binary block to be encrypted")
+        return self.encrypt_run(key, start_addr, data)
+
+    def encrypt_run(self, key: bytes, start_addr: int, data: bytes) -> bytes:
+        """Encrypt consecutive blocks located in one FAC region in a single AES-CTR pass.
+
+        The counter of each block is derived from its address, so the result is identical
+        to the encryption of the data block by block.
+
+        :param key: user for encryption
+        :param start_addr: start address of the data
+        :param data: binary data to be encrypted; the data must not exceed the FAC region
+        :return: encrypted data if they start inside any FAC region; untouched data if they are not in any FAC region
+        """
+        if self._get_run_fac(key, start_addr, len(data)) is None:
+            return data
+        # CTR is a stream cipher, no padding of the data is needed
+        return self._aes_ctr(key, start_addr).encrypt(data)
+
+    def encrypt_image(self, key: bytes, base_address: int, image: bytearray) -> None:
+        """Encrypt in place all blocks of the image located in any FAC region.
+
+        The image is split into blocks of BEE_ENCR_BLOCK_SIZE starting at the base address. The region
+        of the blocks might change only at the boundaries of the FAC regions, so the blocks between two
+        boundaries are encrypted together in a single run.
+
+        :param key: user for encryption
+        :param base_address: address of the image
+        :param image: image data to be encrypted; the data are replaced by the encrypted data
+        """
+        if not self.is_overlapping(base_address, len(image)):
+            return
+        blocks_count = -(-len(image) // BEE_ENCR_BLOCK_SIZE)
+        bounds = {0, blocks_count}
+        regions = [(self._start_addr, self._end_addr)]
+        regions.extend((fac.start_addr, fac.end_addr) for fac in self.fac_regions)
+        for start, end in regions:
+            for addr in (start, end):
+                # index of the first block starting at or above the address
+                index = -(-(addr - base_address) // BEE_ENCR_BLOCK_SIZE)
+                bounds.add(min(max(index, 0), blocks_count))
+        sorted_bounds = sorted(bounds)
+        runs: List[Tuple[int, int]] = []
+        for first, last in zip(sorted_bounds, sorted_bounds[1:]):
+            low = first * BEE_ENCR_BLOCK_SIZE
+            high = min(last * BEE_ENCR_BLOCK_SIZE, len(image))
+            if self._get_run_fac(key, base_address + low, high - low) is None:
+                continue
+            if runs and runs[-1][1] == low:
+                # adjacent run continues the counter sequence, so it is merged with the previous one
+                runs[-1] = (runs[-1][0], high)
+            else:
+                runs.append((low, high))
+
+        def _encrypt_range(run_range: Tuple[int, int]) -> None:
+            low, high = run_range
+            # encrypt in place, without copying the data
+            with memoryview(image)[low:high] as run:
+                self._aes_ctr(key, base_address + low).encrypt(run, output=run)
+
+        total_size = sum(high - low for low, high in runs)
+        if len(runs) < 2 or total_size < _PARALLEL_ENCR_MIN_SIZE or (os.cpu_count() or 1) < 2:
+            for run_range in runs:
+                _encrypt_range(run_range)
+            return
+        # the runs are disjoint, so they can be encrypted concurrently; AES code releases the GIL
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(runs)) as executor:
+            list(executor.map(_encrypt_range, runs))
+
+    def _get_run_fac(self, key: bytes, start_addr: int, length: int) -> Optional[BeeFacRegion]:
+        """Validates encryption of the consecutive blocks and returns FAC region of the blocks.
+
+        :param key: user for encryption
+        :param start_addr: start address of the data
+        :param length: length of the data
+        :return: FAC region the data are located in; None if the data are not in any FAC region
         :raises SPSDKError: When encryption mode different from AES/CTR provided
         :raises SPSDKError: When invalid length of key
         :raises SPSDKError: When invalid range of region
         """
-        if len(data) > BEE_ENCR_BLOCK_SIZE:
-            raise SPSDKError("Incorrect length of binary block to be encrypted")
-        if self.is_inside_region(start_addr):
-            if self.mode != BeeProtectRegionBlockAesMode.CTR:
-                raise SPSDKError("only AES/CTR encryption mode supported now")
-            if len(key) != 16:
-                raise SPSDKError("Invalid length of key")
-            for fac in self.fac_regions:
-                if fac.start_addr <= start_addr < fac.end_addr:
-                    if start_addr + len(data) > fac.end_addr:
-                        raise SPSDKError("Invalid range of region")
-                    cntr_key = Counter(
-                        self.counter,
-                        ctr_value=start_addr >> 4,
-                        ctr_byteorder_encoding="big",
-                    )
-                    logger.debug(
-                        f"Encrypting data, start={hex(start_addr)},"
-                        f"end={hex(start_addr + len(data))} with {self.info()} using fac {fac.info()}"
-                    )
-                    data = align_block_fill_random(data, 16)  # align data to 16 bytes
-                    return crypto_backend().aes_ctr_encrypt(key, data, cntr_key.value)
-        return data
+        if not self.is_inside_region(start_addr):
+            return None
+        if self.mode != BeeProtectRegionBlockAesMode.CTR:
+            raise SPSDKError("only AES/CTR encryption mode supported now")
+        if len(key) != 16:
+            raise SPSDKError("Invalid length of key")
+        fac = self.get_fac_region(start_addr)
+        if fac is None:
+            return None
+        if start_addr + length > fac.end_addr:
+            raise SPSDKError("Invalid range of region")
+        logger.debug(
+            f"Encrypting data, start={hex(start_addr)},"
+            f"end={hex(start_addr + length)} with {self.info()} using fac {fac.info()}"
+        )
+        return fac
+
+    def _aes_ctr(self, key: bytes, start_addr: int) -> Any:
+        """Create AES/CTR cipher for data starting at the address.
+
+        The counter is 12-byte nonce followed by 32-bit big-endian value of the 16-byte block address;
+        the counter is incremented internally for each 16-byte block.
+
+        :param key: user for encryption
+        :param start_addr: start address of the data
+        :return: AES/CTR cipher object
+        """
+        ctr_value = int.from_bytes(self.counter[-4:], "big") + (start_addr >> 4)
+        return AES.new(key, AES.MODE_CTR, nonce=self.counter[:-4], initial_value=ctr_value)
 
 
 class BeeKIB(BeeBaseClass):
@@ -394,6 +531,8 @@ class BeeKIB(BeeBaseClass):
     Contains keys used to encrypt PRDB content.
     """
 
+    __slots__ = ("kib_key", "kib_iv")
+
     # key length in bytes
     _KEY_LEN = 16
     # format of the binary representation of the class, used as parameter for struct.pack/unpack methods
@@ -409,6 +548,13 @@ class BeeKIB(BeeBaseClass):
         self.kib_key = kib_key if kib_key else crypto_backend().random_bytes(16)
         self.kib_iv = kib_iv if kib_iv else crypto_backend().random_bytes(16)
 
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, self.__class__)
+            and self.kib_key == other.kib_key
+            and self.kib_iv == other.kib_iv
+        )
+
     def info(self) -> str:
         """:return: test description of the instance."""
         return f"BEE-KIB: {self.kib_key.hex()}, {self.kib_iv.hex()}"
@@ -427,7 +573,7 @@ class BeeKIB(BeeBaseClass):
     def export(self) -> bytes:
         """Exports binary representation of the region (serialization)."""
         result = super().export()
-        return result + pack(self._struct_format(), self.kib_key, self.kib_iv)
+        return result + self._STRUCT.pack(self.kib_key, self.kib_iv)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "BeeKIB":
@@ -438,7 +584,7 @@ class BeeKIB(BeeBaseClass):
         :return: instance created from binary data
         """
         super().parse(data, offset)  # check size of the input data
-        (key, iv) = unpack_from(BeeKIB._struct_format(), data, offset)
+        (key, iv) = BeeKIB._STRUCT.unpack_from(data, offset)
         result = cls(key, iv)
         result.validate()
         return result
@@ -451,6 +597,8 @@ class BeeRegionHeader(BeeBaseClass):
     PRDB_OFFSET = 0x80
     # total size including padding
     SIZE = 0x200
+    # SW key split into fuse words, the last word is burned to the lowest address
+    _FUSES_STRUCT = Struct(">4I")
 
     @classmethod
     def _struct_format(cls) -> str:
@@ -476,10 +624,24 @@ class BeeRegionHeader(BeeBaseClass):
         :param sw_key: key used to encrypt KIB content
         :param kib: keys block; None to use default
         """
+        if prdb is None and sw_key is None and kib is None:
+            # all random values are generated at once: SW key, KIB key, KIB IV and counter nonce
+            rnd = crypto_backend().random_bytes(60)
+            sw_key = rnd[:16]
+            kib = BeeKIB(rnd[16:32], rnd[32:48])
+            prdb = BeeProtectRegionBlock(counter=rnd[48:] + bytes(4))
         self._prdb = prdb if (prdb is not None) else BeeProtectRegionBlock()
         self._sw_key = sw_key if (sw_key is not None) else crypto_backend().random_bytes(16)
         self._kib = kib if (kib is not None) else BeeKIB()
 
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, self.__class__)
+            and self._prdb == other._prdb
+            and self._sw_key == other._sw_key
+            and self._kib == other._kib
+        )
+
     def add_fac(self, fac: BeeFacRegion) -> None:
         """Append FAC region.
 
@@ -504,10 +666,7 @@ class BeeRegionHeader(BeeBaseClass):
 
         The result is ordered, first value should be burned to the lowest address.
         """
-        result = []
-        for pos in range(16, 0, -4):
-            result.append(unpack_from(">I", self._sw_key[pos - 4 : pos])[0])
-        return result
+        return self._FUSES_STRUCT.unpack_from(self._sw_key)[::-1]
 
     def update(self) -> None:
         """Updates internal fields of the instance."""
@@ -535,17 +694,19 @@ class BeeRegionHeader(BeeBaseClass):
         # KIB
         kib_data = self._kib.export()
         dbg_info.append_binary_section("BEE-KIB (non-crypted)", kib_data)
-        aes_ecb = AES.new(self._sw_key, AES.MODE_ECB)
-        result += aes_ecb.encrypt(kib_data)
-        # padding
-        result = extend_block(result, self.PRDB_OFFSET)
         # PRDB
         prdb_data = self._prdb.export()
         dbg_info.append_binary_section("BEE-PRDB (non-crypted)", prdb_data)
+        # zero-filled header, the ciphers write the encrypted data directly into their areas; the rest is padding
+        header = bytearray(self.SIZE)
+        view = memoryview(header)
+        aes_ecb = AES.new(self._sw_key, AES.MODE_ECB)
+        aes_ecb.encrypt(kib_data, output=view[: len(kib_data)])
         aes_cbc = AES.new(self._kib.kib_key, AES.MODE_CBC, self._kib.kib_iv)
-        result += aes_cbc.encrypt(prdb_data)
-        # padding
-        return extend_block(result, self.SIZE)
+        aes_cbc.encrypt(
+            prdb_data, output=view[self.PRDB_OFFSET : self.PRDB_OFFSET + len(prdb_data)]
+        )
+        return result + bytes(header)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0, sw_key: bytes = b"") -> "BeeRegionHeader":
@@ -579,6 +740,14 @@ class BeeRegionHeader(BeeBaseClass):
         """
         return self._prdb.is_inside_region(start_addr)
 
+    def is_overlapping(self, start_addr: int, length: int) -> bool:
+        """Returns true if the data overlaps the region of the FAC regions.
+
+        :param start_addr: start address of the data
+        :param length: length of the data
+        """
+        return self._prdb.is_overlapping(start_addr, length)
+
     def encrypt_block(self, start_addr: int, data: bytes) -> bytes:
         """Encrypt block located in any FAC region.
 
@@ -588,6 +757,14 @@ class BeeRegionHeader(BeeBaseClass):
         """
         return self._prdb.encrypt_block(self._sw_key, start_addr, data)
 
+    def encrypt_image(self, base_address: int, image: bytearray) -> None:
+        """Encrypt in place all blocks of the image located in any FAC region.
+
+        :param base_address: address of the image
+        :param image: image data to be encrypted; the data are replaced by the encrypted data
+        """
+        self._prdb.encrypt_image(self._sw_key, base_address, image)
+
 
 class BeeNxp:
     """BeeNxp class."""
@@ -613,16 +790,17 @@ class BeeNxp:
 
         :return: encrypted image
         """
-        encrypted_data = bytearray()
-        image_data = bytearray(self.input_image)
-        base_address = self.base_address
-
-        for block in split_data(image_data, BEE_ENCR_BLOCK_SIZE):
-            logger.debug(f"Reading {hex(base_address)}, size={hex(len(block))}")
-            for header in self.headers:
-                block = header.encrypt_block(base_address, block)
-            encrypted_data.extend(block)
-            base_address += len(block)
+        headers = [
+            header
+            for header in self.headers
+            if header.is_overlapping(self.base_address, len(self.input_image))
+        ]
+        if not headers:
+            return bytes(self.input_image)
+
+        encrypted_data = bytearray(self.input_image)
+        for header in headers:
+            header.encrypt_image(self.base_address, encrypted_data)
 
         return bytes(encrypted_data)
 
@@ -643,8 +821,7 @@ class BeeNxp:
 
         :return: List of supported families.
         """
-        database = Database(BEE_DATABASE_FILE)
-        return database.devices.device_names
+        return _get_database().devices.device_names
 
     @staticmethod
     def get_validation_schemas() -> List[Dict[str, Any]]:
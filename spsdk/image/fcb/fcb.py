@@ -27,6 +27,8 @@ from spsdk.utils.schema_validator import ConfigTemplate, ValidationSchemas
 class FCB(SegmentBase):
     """FCB (Flash Configuration Block)."""
 
+    __slots__ = ("mem_type",)
+
     def __init__(self, family: str, mem_type: str, revision: str = "latest") -> None:
         """FCB Constructor.
 
@@ -46,8 +48,8 @@ class FCB(SegmentBase):
         self._registers.load_registers_from_xml(os.path.join(FCB_DATA_FOLDER, block_file_name))
 
     @staticmethod
-    def get_database() -> Database:
-        """Get the devices database."""
+    def _load_database() -> Database:
+        """Load the devices database."""
         return Database(FCB_DATABASE_FILE)
 
     @property
@@ -8,16 +8,51 @@
 """This module contains generic implementation of image segment."""
 
 import abc
-from typing import Any, Dict
+import functools
+from copy import deepcopy
+from struct import Struct
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
 
 from spsdk.exceptions import SPSDKValueError
 from spsdk.utils.database import Database
 from spsdk.utils.registers import Registers
 
+# struct format characters of little-endian registers by their bit width
+_REGISTER_FORMATS = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_registers_struct(layout: Tuple[Tuple[int, int], ...]) -> Optional[Struct]:
+    """Get precompiled struct to unpack all registers of the layout at once.
+
+    :param layout: Offset and width of the registers in bits.
+    :return: Struct with one item per register; None if the registers are not byte aligned or sorted by offset.
+    """
+    fmt = "<"
+    position = 0
+    for offset, width in layout:
+        if offset % 8 or width % 8 or offset < position:
+            return None
+        if offset > position:
+            fmt += f"{(offset - position) // 8}x"
+        # registers of uncommon width are unpacked as bytes
+        fmt += _REGISTER_FORMATS.get(width, f"{width // 8}s")
+        position = offset + width
+    return Struct(fmt)
+
 
 class SegmentBase:
     """Base class for image segment."""
 
+    __slots__ = ("family", "revision", "_registers")
+
+    # cached database lookups of segment classes, the database content doesn't change during the run
+    _database_cache: Dict[Type["SegmentBase"], Database] = {}
+    _families_cache: Dict[Type["SegmentBase"], List[str]] = {}
+    _families_set_cache: Dict[Type["SegmentBase"], FrozenSet[str]] = {}
+    _memory_types_cache: Dict[Tuple[Type["SegmentBase"], str, str], dict] = {}
+    _memory_type_names_cache: Dict[Tuple[Type["SegmentBase"], str, str], Tuple[str, ...]] = {}
+
     def __init__(self, family: str, revision: str) -> None:
         """Segment base Constructor.
 
@@ -25,7 +60,7 @@ class SegmentBase:
         :param revision: Optional Chip family revision.
         :raises SPSDKValueError: Unsupported family.
         """
-        if family not in self.get_supported_families():
+        if family not in self._get_supported_families_set():
             raise SPSDKValueError(
                 f"Unsupported chip family:{family}. {family} not in {self.get_supported_families()}"
             )
@@ -42,7 +77,16 @@ class SegmentBase:
 
         :return: Binary representation of segment.
         """
-        return self.registers.image_info().export()
+        registers = self.registers.get_registers()
+        regs_struct = _get_registers_struct(tuple((reg.offset, reg.width) for reg in registers))
+        if not regs_struct:
+            return self.registers.image_info().export()
+        # registers don't overlap and the gaps are zeros, so just place them into the buffer
+        data = bytearray(regs_struct.size)
+        for reg in registers:
+            offset = reg.offset // 8
+            data[offset : offset + reg.width // 8] = reg.get_bytes_value()
+        return bytes(data)
 
     def parse(self, binary: bytes) -> None:
         """Parse binary block into segment object.
@@ -50,14 +94,26 @@ class SegmentBase:
         :param binary: binary image.
         :raises SPSDKValueError: Invalid input binary length.
         """
-        if len(binary) != len(self.registers.image_info()):
-            raise SPSDKValueError(
-                f"Invalid length of input binary: {len(binary)} != {len(self.registers.image_info())}"
-            )
-        for reg in self.registers.get_registers():
-            reg.set_value(
-                int.from_bytes(binary[reg.offset // 8 : reg.offset // 8 + reg.width // 8], "little")
-            )
+        registers = self.registers.get_registers()
+        regs_struct = _get_registers_struct(tuple((reg.offset, reg.width) for reg in registers))
+        # the struct covers the whole layout, so its size is the length of the exported image
+        image_len = regs_struct.size if regs_struct else len(self.registers.image_info())
+        if len(binary) != image_len:
+            raise SPSDKValueError(f"Invalid length of input binary: {len(binary)} != {image_len}")
+        if regs_struct:
+            values = [
+                value if isinstance(value, int) else int.from_bytes(value, "little")
+                for value in regs_struct.unpack_from(binary)
+            ]
+        else:
+            # zero-copy slices of the binary
+            data = memoryview(binary)
+            values = [
+                int.from_bytes(data[reg.offset // 8 : reg.offset // 8 + reg.width // 8], "little")
+                for reg in registers
+            ]
+        for reg, value in zip(registers, values):
+            reg.set_value(value)
 
     @staticmethod
     @abc.abstractmethod
@@ -81,7 +137,16 @@ class SegmentBase:
 
         :return: List of supported families.
         """
-        return cls.get_database().devices.device_names
+        if cls not in SegmentBase._families_cache:
+            SegmentBase._families_cache[cls] = cls.get_database().devices.device_names
+        return list(SegmentBase._families_cache[cls])
+
+    @classmethod
+    def _get_supported_families_set(cls) -> FrozenSet[str]:
+        """Return set of supported families for fast membership checks."""
+        if cls not in SegmentBase._families_set_cache:
+            SegmentBase._families_set_cache[cls] = frozenset(cls.get_supported_families())
+        return SegmentBase._families_set_cache[cls]
 
     @classmethod
     def get_memory_types(cls, family: str, revision: str = "latest") -> dict:
@@ -90,7 +155,12 @@ class SegmentBase:
         :param family: Chip family.
         :param revision: Optional Chip family revision.
         """
-        return cls.get_database().get_device_value("mem_types", family, revision, default={})
+        key = (cls, family, revision)
+        if key not in SegmentBase._memory_types_cache:
+            SegmentBase._memory_types_cache[key] = cls.get_database().get_device_value(
+                "mem_types", family, revision, default={}
+            )
+        return deepcopy(SegmentBase._memory_types_cache[key])
 
     @classmethod
     def get_supported_memory_types(cls, family: str, revision: str = "latest") -> list:
@@ -99,9 +169,25 @@ class SegmentBase:
         :param family: Chip family.
         :param revision: Optional Chip family revision.
         """
-        return list(cls.get_memory_types(family, revision).keys())
+        key = (cls, family, revision)
+        if key not in SegmentBase._memory_type_names_cache:
+            SegmentBase._memory_type_names_cache[key] = tuple(
+                cls.get_memory_types(family, revision).keys()
+            )
+        # the result is used as an enum in validation schemas, those must be lists
+        return list(SegmentBase._memory_type_names_cache[key])
+
+    @classmethod
+    def get_database(cls) -> Database:
+        """Get the devices database, it's loaded just once per segment class.
+
+        :return: Database of the segment class.
+        """
+        if cls not in SegmentBase._database_cache:
+            SegmentBase._database_cache[cls] = cls._load_database()
+        return SegmentBase._database_cache[cls]
 
     @staticmethod
     @abc.abstractmethod
-    def get_database() -> Database:
-        """Get the devices database."""
+    def _load_database() -> Database:
+        """Load the devices database."""
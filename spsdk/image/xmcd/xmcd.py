@@ -73,6 +73,8 @@ class ConfigurationBlockType(Enum):
 class XMCD(SegmentBase):
     """XMCD (External Memory Configuration Data)."""
 
+    __slots__ = ("_mem_type", "_config_type")
+
     def __init__(self, family: str, revision: str = "latest") -> None:
         """XMCD Constructor.
 
@@ -134,8 +136,8 @@ class XMCD(SegmentBase):
         self._registers = value
 
     @staticmethod
-    def get_database() -> Database:
-        """Get the devices database."""
+    def _load_database() -> Database:
+        """Load the devices database."""
         return Database(XMCD_DATABASE_FILE)
 
     def parse(self, binary: bytes) -> None:
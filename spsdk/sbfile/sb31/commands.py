@@ -6,15 +6,53 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Module for creation commands."""
 
+import sys
 from abc import abstractmethod
+from array import array
 from enum import Enum as BuiltinEnum
-from struct import calcsize, pack, unpack_from
+from struct import Struct
 from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from spsdk import SPSDKError
 from spsdk.sbfile.sb31.constants import EnumCmdTag
 from spsdk.utils.easy_enum import Enum
-from spsdk.utils.misc import align_block, load_binary, value_to_int
+from spsdk.utils.misc import align, load_binary, value_to_int
+
+# layout of the 16 bytes block following the command header (memory ID, pattern, etc.)
+_BLOCK_STRUCT = Struct("<4L")
+# command header together with the 16 bytes block, used by the commands of fixed size
+_HEADER_BLOCK_STRUCT = Struct("<8L")
+
+# command tags accepted by CmdLoadBase.parse
+_LOAD_CMD_TAGS = frozenset(
+    (
+        EnumCmdTag.LOAD,
+        EnumCmdTag.LOAD_CMAC,
+        EnumCmdTag.LOAD_HASH_LOCKING,
+        EnumCmdTag.LOAD_KEY_BLOB,
+        EnumCmdTag.PROGRAM_FUSES,
+        EnumCmdTag.PROGRAM_IFR,
+    )
+)
+# names of command tags, EnumCmdTag.name scans all members on every call
+_CMD_TAG_NAMES: Dict[int, str] = {tag: EnumCmdTag.name(tag) for tag in EnumCmdTag.tags()}
+
+# _pack_words relies on 32-bit items of array("I"), the C standard guarantees just 16 bits
+if array("I").itemsize != 4:  # pragma: no cover
+    raise SPSDKError("Unsupported platform: array('I') items are not 32-bit")
+
+
+def _pack_words(values: List[int]) -> bytes:
+    """Pack 32-bit values into little-endian bytes.
+
+    :param values: List of 32-bit values
+    :return: Packed values
+    """
+    words = array("I", values)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words.tobytes()
+
 
 ########################################################################################################################
 # Main Class
@@ -24,9 +62,26 @@ from spsdk.utils.misc import align_block, load_binary, value_to_int
 class MainCmd:
     """Functions for creating cmd intended for inheritance."""
 
+    __slots__ = ()
+    # names of all instance attributes, collected from __slots__ of the class hierarchy
+    _FIELDS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = tuple(
+            name for klass in reversed(cls.__mro__) for name in vars(klass).get("__slots__", ())
+        )
+
     def __eq__(self, obj: object) -> bool:
-        """Comparison of values."""
-        return isinstance(obj, self.__class__) and vars(obj) == vars(self)
+        """Comparison of values.
+
+        Attributes of subclasses not declaring `__slots__` are kept in `__dict__`, compare them too.
+        """
+        return (
+            isinstance(obj, self.__class__)
+            and all(getattr(obj, name) == getattr(self, name) for name in self._FIELDS)
+            and getattr(obj, "__dict__", None) == getattr(self, "__dict__", None)
+        )
 
     def __str__(self) -> str:
         """Get info of command."""
@@ -77,8 +132,11 @@ class MainCmd:
 class BaseCmd(MainCmd):
     """Functions for creating cmd intended for inheritance."""
 
+    __slots__ = ("_address", "_length", "cmd_tag")
+
     FORMAT = "<4L"
-    SIZE = calcsize(FORMAT)
+    _STRUCT = Struct(FORMAT)
+    SIZE = _STRUCT.size
     TAG = 0x55AAAA55
 
     @property
@@ -125,7 +183,7 @@ class BaseCmd(MainCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        return pack(self.FORMAT, self.TAG, self.address, self.length, self.cmd_tag)
+        return self._STRUCT.pack(self.TAG, self.address, self.length, self.cmd_tag)
 
     @classmethod
     def header_parse(cls, cmd_tag: int, data: bytes, offset: int = 0) -> Tuple[int, int]:
@@ -138,12 +196,44 @@ class BaseCmd(MainCmd):
         :raises SPSDKError: Raised if cmd is not equal EnumCmdTag
         :return: Tuple
         """
-        tag, address, length, cmd = unpack_from(cls.FORMAT, data, offset)
+        tag, address, length, cmd = cls._STRUCT.unpack_from(data, offset)
+        cls._check_header(tag, cmd, cmd_tag)
+        return address, length
+
+    @classmethod
+    def header_block_parse(
+        cls, cmd_tag: int, data: bytes, offset: int = 0
+    ) -> Tuple[int, int, int, int, int, int]:
+        """Parse header command together with the following 16 bytes block from bytes array.
+
+        :param data: Input data as bytes array
+        :param offset: The offset of input data
+        :param cmd_tag: Information about command tag
+        :return: Address, length and the four values of the block
+        """
+        values = _HEADER_BLOCK_STRUCT.unpack_from(data, offset)
+        cls._check_header(values[0], values[3], cmd_tag)
+        return values[1], values[2], values[4], values[5], values[6], values[7]
+
+    def export_with_block(self, *block: int) -> bytes:
+        """Export command header together with the following 16 bytes block.
+
+        :param block: The four values of the block
+        :return: Exported bytes
+        """
+        return _HEADER_BLOCK_STRUCT.pack(self.TAG, self.address, self.length, self.cmd_tag, *block)
+
+    @classmethod
+    def _check_header(cls, tag: int, cmd: int, cmd_tag: int) -> None:
+        """Check the tag and command tag of parsed header.
+
+        :raises SPSDKError: Raised if tag is not equal to required TAG
+        :raises SPSDKError: Raised if cmd is not equal EnumCmdTag
+        """
         if tag != cls.TAG:
             raise SPSDKError("TAG is not valid.")
         if cmd != cmd_tag:
             raise SPSDKError("Values are not same.")
-        return address, length
 
 
 ########################################################################################################################
@@ -152,7 +242,11 @@ class BaseCmd(MainCmd):
 class CmdLoadBase(BaseCmd):
     """Base class for commands loading data."""
 
+    __slots__ = ("memory_id", "data")
+
     HAS_MEMORY_ID_BLOCK = True
+    # count of zero bytes appended after the aligned data
+    TAIL_PAD = 0
 
     def __init__(self, cmd_tag: int, address: int, data: bytes, memory_id: int = 0) -> None:
         """Constructor for command.
@@ -168,16 +262,18 @@ class CmdLoadBase(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        data = super().export()
+        offset = self.SIZE + (_BLOCK_STRUCT.size if self.HAS_MEMORY_ID_BLOCK else 0)
+        # the buffer is zero-filled, so the alignment padding and the tail are already in place
+        data = bytearray(align(offset + len(self.data), 16) + self.TAIL_PAD)
+        self._STRUCT.pack_into(data, 0, self.TAG, self.address, self.length, self.cmd_tag)
         if self.HAS_MEMORY_ID_BLOCK:
-            data += pack("<4L", self.memory_id, 0, 0, 0)
-        data += self.data
-        data = align_block(data, alignment=16)
-        return data
+            _BLOCK_STRUCT.pack_into(data, self.SIZE, self.memory_id, 0, 0, 0)
+        data[offset : offset + len(self.data)] = self.data
+        return bytes(data)
 
     def info(self) -> str:
         """Get info about the load command."""
-        msg = f"{EnumCmdTag.name(self.cmd_tag)}: "
+        msg = f"{_CMD_TAG_NAMES.get(self.cmd_tag) or EnumCmdTag.name(self.cmd_tag)}: "
         if self.HAS_MEMORY_ID_BLOCK:
             msg += f"Address=0x{self.address:08X}, Length={self.length}, Memory ID={self.memory_id}"
         else:
@@ -186,13 +282,13 @@ class CmdLoadBase(BaseCmd):
 
     @classmethod
     def _extract_data(cls, data: bytes, offset: int = 0) -> Tuple[int, int, bytes, int, int]:
-        tag, address, length, cmd = unpack_from(cls.FORMAT, data)
+        tag, address, length, cmd = cls._STRUCT.unpack_from(data)
         memory_id = 0
         if tag != cls.TAG:
             raise SPSDKError(f"Invalid TAG, expected: {cls.TAG}")
         offset += BaseCmd.SIZE
         if cls.HAS_MEMORY_ID_BLOCK:
-            memory_id, pad0, pad1, pad2 = unpack_from("<4L", data, offset=offset)
+            memory_id, pad0, pad1, pad2 = _BLOCK_STRUCT.unpack_from(data, offset)
             if not pad0 == pad1 == pad2 == 0:
                 raise SPSDKError("Invalid padding")
             offset += 16
@@ -209,14 +305,7 @@ class CmdLoadBase(BaseCmd):
         :raises SPSDKError: Invalid cmd_tag was found
         """
         address, _, data, cmd_tag, memory_id = cls._extract_data(data, offset)
-        if cmd_tag not in [
-            EnumCmdTag.LOAD,
-            EnumCmdTag.LOAD_CMAC,
-            EnumCmdTag.LOAD_HASH_LOCKING,
-            EnumCmdTag.LOAD_KEY_BLOB,
-            EnumCmdTag.PROGRAM_FUSES,
-            EnumCmdTag.PROGRAM_IFR,
-        ]:
+        if cmd_tag not in _LOAD_CMD_TAGS:
             raise SPSDKError(f"Invalid cmd_tag found: {cmd_tag}")
         if cls == CmdLoadBase:
             return cls(cmd_tag=cmd_tag, address=address, data=data, memory_id=memory_id)
@@ -240,6 +329,8 @@ class CmdLoadBase(BaseCmd):
 class CmdErase(BaseCmd):
     """Erase given address range. The erase will be rounded up to the sector size."""
 
+    __slots__ = ("memory_id",)
+
     def __init__(self, address: int, length: int, memory_id: int = 0) -> None:
         """Constructor for command.
 
@@ -258,9 +349,7 @@ class CmdErase(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        data = super().export()
-        data += pack("<4L", self.memory_id, 0, 0, 0)
-        return data
+        return self.export_with_block(self.memory_id, 0, 0, 0)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdErase":
@@ -271,8 +360,9 @@ class CmdErase(BaseCmd):
         :return: CmdErase
         :raises SPSDKError: Invalid padding
         """
-        address, length = cls.header_parse(data=data, offset=offset, cmd_tag=EnumCmdTag.ERASE)
-        memory_id, pad0, pad1, pad2 = unpack_from("<4L", data, offset=offset + 16)
+        address, length, memory_id, pad0, pad1, pad2 = cls.header_block_parse(
+            data=data, offset=offset, cmd_tag=EnumCmdTag.ERASE
+        )
         if not pad0 == pad1 == pad2 == 0:
             raise SPSDKError("Invalid padding")
         return cls(address=address, length=length, memory_id=memory_id)
@@ -296,6 +386,8 @@ class CmdErase(BaseCmd):
 class CmdLoad(CmdLoadBase):
     """Data to write follows the range header."""
 
+    __slots__ = ()
+
     def __init__(self, address: int, data: bytes, memory_id: int = 0) -> None:
         """Constructor for command.
 
@@ -335,7 +427,7 @@ class CmdLoad(CmdLoadBase):
             return CmdLoad(address=address, data=data, memory_id=memory_id)
         if config.get("values"):
             values = [value_to_int(s, 0) for s in config["values"].split(",")]
-            data = pack(f"<{len(values)}L", *values)
+            data = _pack_words(values)
             return CmdLoad(address=address, data=data, memory_id=memory_id)
 
         raise SPSDKError(f"Unsupported LOAD command args: {config}")
@@ -344,6 +436,8 @@ class CmdLoad(CmdLoadBase):
 class CmdExecute(BaseCmd):
     """Address will be the jump-to address."""
 
+    __slots__ = ()
+
     def __init__(self, address: int) -> None:
         """Constructor for Command.
 
@@ -383,6 +477,8 @@ class CmdExecute(BaseCmd):
 class CmdCall(BaseCmd):
     """Address will be the address to jump."""
 
+    __slots__ = ()
+
     def __init__(self, address: int) -> None:
         """Constructor for Command.
 
@@ -422,6 +518,8 @@ class CmdCall(BaseCmd):
 class CmdProgFuses(CmdLoadBase):
     """Address will be address of fuse register."""
 
+    __slots__ = ()
+
     HAS_MEMORY_ID_BLOCK = False
 
     def __init__(self, address: int, data: bytes) -> None:
@@ -435,15 +533,15 @@ class CmdProgFuses(CmdLoadBase):
 
     @classmethod
     def _extract_data(cls, data: bytes, offset: int = 0) -> Tuple[int, int, bytes, int, int]:
-        tag, address, length, cmd = unpack_from(cls.FORMAT, data)
+        tag, address, length, cmd = cls._STRUCT.unpack_from(data)
         length *= 4
         memory_id = 0
         if tag != cls.TAG:
             raise SPSDKError(f"Invalid TAG, expected: {cls.TAG}")
         offset += BaseCmd.SIZE
         if cls.HAS_MEMORY_ID_BLOCK:
-            memory_id, pad0, pad1, pad2 = unpack_from("<4L", data, offset=offset)
-            if pad0 != pad1 != pad2 != 0:
+            memory_id, pad0, pad1, pad2 = _BLOCK_STRUCT.unpack_from(data, offset)
+            if not pad0 == pad1 == pad2 == 0:
                 raise SPSDKError("Invalid padding")
             offset += 16
         load_data = data[offset : offset + length]
@@ -472,13 +570,15 @@ class CmdProgFuses(CmdLoadBase):
         """
         address = value_to_int(config["address"], 0)
         fuses = [value_to_int(fuse, 0) for fuse in config["values"].split(",")]
-        data = pack(f"<{len(fuses)}L", *fuses)
+        data = _pack_words(fuses)
         return CmdProgFuses(address=address, data=data)
 
 
 class CmdProgIfr(CmdLoadBase):
     """Address will be the address into the IFR region."""
 
+    __slots__ = ()
+
     HAS_MEMORY_ID_BLOCK = False
 
     def __init__(self, address: int, data: bytes) -> None:
@@ -518,6 +618,8 @@ class CmdProgIfr(CmdLoadBase):
 class CmdLoadCmac(CmdLoadBase):
     """Load cmac. ROM is calculating cmac from loaded data."""
 
+    __slots__ = ()
+
     def __init__(self, address: int, data: bytes, memory_id: int = 0) -> None:
         """Constructor for command.
 
@@ -553,6 +655,8 @@ class CmdLoadCmac(CmdLoadBase):
 class CmdCopy(BaseCmd):
     """Copy data from one place to another."""
 
+    __slots__ = ("destination_address", "memory_id_from", "memory_id_to")
+
     def __init__(
         self,
         address: int,
@@ -584,9 +688,9 @@ class CmdCopy(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        data = super().export()
-        data += pack("<4L", self.destination_address, self.memory_id_from, self.memory_id_to, 0)
-        return data
+        return self.export_with_block(
+            self.destination_address, self.memory_id_from, self.memory_id_to, 0
+        )
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdCopy":
@@ -597,10 +701,8 @@ class CmdCopy(BaseCmd):
         :return: CmdCopy
         :raises SPSDKError: Invalid padding
         """
-        address, length = cls.header_parse(data=data, offset=offset, cmd_tag=EnumCmdTag.COPY)
-        destination_address, memory_id_from, memory_id_to, pad0 = unpack_from(
-            "<4L", data, offset=offset + 16
-        )
+        values = cls.header_block_parse(data=data, offset=offset, cmd_tag=EnumCmdTag.COPY)
+        address, length, destination_address, memory_id_from, memory_id_to, pad0 = values
         if pad0 != 0:
             raise SPSDKError("Invalid padding")
         return cls(
@@ -638,6 +740,11 @@ class CmdCopy(BaseCmd):
 class CmdLoadHashLocking(CmdLoadBase):
     """Load hash. ROM is calculating hash."""
 
+    __slots__ = ()
+
+    # space for the hash calculated by ROM
+    TAIL_PAD = 64
+
     def __init__(self, address: int, data: bytes, memory_id: int = 0) -> None:
         """Constructor for command.
 
@@ -652,12 +759,6 @@ class CmdLoadHashLocking(CmdLoadBase):
             memory_id=memory_id,
         )
 
-    def export(self) -> bytes:
-        """Export command as bytes."""
-        data = super().export()
-        data += bytes(64)
-        return data
-
     @classmethod
     def load_from_config(
         cls, config: Dict[str, Any], search_paths: Optional[List[str]] = None
@@ -679,7 +780,10 @@ class CmdLoadHashLocking(CmdLoadBase):
 class CmdLoadKeyBlob(BaseCmd):
     """Load key blob."""
 
+    __slots__ = ("key_wrap_id", "data")
+
     FORMAT = "<L2H2L"
+    _STRUCT = Struct(FORMAT)
 
     class _KeyWraps(BuiltinEnum):
         """KeyWrap IDs used by the CmdLoadKeyBlob command."""
@@ -721,18 +825,13 @@ class CmdLoadKeyBlob(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        result_data = pack(
-            self.FORMAT,
-            self.TAG,
-            self.address,
-            self.key_wrap_id,
-            self.length,
-            self.cmd_tag,
+        # the buffer is zero-filled, so the alignment padding is already in place
+        data = bytearray(align(self.SIZE + len(self.data), 16))
+        self._STRUCT.pack_into(
+            data, 0, self.TAG, self.address, self.key_wrap_id, self.length, self.cmd_tag
         )
-        result_data += self.data
-
-        result_data = align_block(data=result_data, alignment=16, padding=0)
-        return result_data
+        data[self.SIZE : self.SIZE + len(self.data)] = self.data
+        return bytes(data)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdLoadKeyBlob":
@@ -741,11 +840,13 @@ class CmdLoadKeyBlob(BaseCmd):
         :param data: Input data as bytes array
         :param offset: The offset of input data
         :return: CmdLoadKeyBlob
+        :raises SPSDKError: Key blob data are shorter than the length in header
         """
-        tag, cmpa_offset, key_wrap_id, length, cmd = unpack_from(  # pylint: disable=unused-variable
-            cls.FORMAT, data, offset
-        )
-        key_blob_data = unpack_from(f"<{length}s", data, offset + cls.SIZE)[0]
+        # pylint: disable=unused-variable
+        tag, cmpa_offset, key_wrap_id, length, cmd = cls._STRUCT.unpack_from(data, offset)
+        key_blob_data = bytes(data[offset + cls.SIZE : offset + cls.SIZE + length])
+        if len(key_blob_data) != length:
+            raise SPSDKError("Invalid length of key blob data")
         return cls(offset=cmpa_offset, key_wrap_id=key_wrap_id, data=key_blob_data)
 
     @classmethod
@@ -770,6 +871,8 @@ class CmdLoadKeyBlob(BaseCmd):
 class CmdConfigureMemory(BaseCmd):
     """Configure memory."""
 
+    __slots__ = ("memory_id",)
+
     def __init__(self, address: int, memory_id: int = 0) -> None:
         """Constructor for command.
 
@@ -785,7 +888,7 @@ class CmdConfigureMemory(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        return pack(self.FORMAT, self.TAG, self.memory_id, self.address, self.cmd_tag)
+        return self._STRUCT.pack(self.TAG, self.memory_id, self.address, self.cmd_tag)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdConfigureMemory":
@@ -819,6 +922,8 @@ class CmdConfigureMemory(BaseCmd):
 class CmdFillMemory(BaseCmd):
     """Fill memory range by pattern."""
 
+    __slots__ = ("pattern",)
+
     def __init__(self, address: int, length: int, pattern: int) -> None:
         """Constructor for command.
 
@@ -835,9 +940,7 @@ class CmdFillMemory(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        data = super().export()
-        data += pack("<4L", self.pattern, 0, 0, 0)
-        return data
+        return self.export_with_block(self.pattern, 0, 0, 0)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdFillMemory":
@@ -848,9 +951,10 @@ class CmdFillMemory(BaseCmd):
         :return: CmdErase
         :raises SPSDKError: Invalid padding
         """
-        address, length = cls.header_parse(data=data, offset=offset, cmd_tag=EnumCmdTag.FILL_MEMORY)
-        pattern, pad0, pad1, pad2 = unpack_from("<4L", data, offset=offset + 16)
-        if pad0 != pad1 != pad2 != 0:
+        address, length, pattern, pad0, pad1, pad2 = cls.header_block_parse(
+            data=data, offset=offset, cmd_tag=EnumCmdTag.FILL_MEMORY
+        )
+        if not pad0 == pad1 == pad2 == 0:
             raise SPSDKError("Invalid padding")
         return cls(address=address, length=length, pattern=pattern)
 
@@ -873,6 +977,8 @@ class CmdFillMemory(BaseCmd):
 class CmdFwVersionCheck(BaseCmd):
     """Check counter value with stored value, if values are not same, SB file is rejected."""
 
+    __slots__ = ("value", "counter_id")
+
     class CounterID(Enum):
         """Counter IDs used by the CmdFwVersionCheck command."""
 
@@ -899,7 +1005,7 @@ class CmdFwVersionCheck(BaseCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        return pack(self.FORMAT, self.TAG, self.value, self.counter_id, self.cmd_tag)
+        return self._STRUCT.pack(self.TAG, self.value, self.counter_id, self.cmd_tag)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdFwVersionCheck":
@@ -933,8 +1039,11 @@ class CmdFwVersionCheck(BaseCmd):
 class CmdSectionHeader(MainCmd):
     """Create section header."""
 
+    __slots__ = ("section_uid", "section_type", "length", "_pad")
+
     FORMAT = "<4L"
-    SIZE = calcsize(FORMAT)
+    _STRUCT = Struct(FORMAT)
+    SIZE = _STRUCT.size
 
     def __init__(self, length: int, section_uid: int = 1, section_type: int = 1) -> None:
         """Constructor for Commands section.
@@ -954,7 +1063,7 @@ class CmdSectionHeader(MainCmd):
 
     def export(self) -> bytes:
         """Export command as bytes."""
-        return pack(self.FORMAT, self.section_uid, self.section_type, self.length, self._pad)
+        return self._STRUCT.pack(self.section_uid, self.section_type, self.length, self._pad)
 
     @classmethod
     def parse(cls, data: bytes, offset: int = 0) -> "CmdSectionHeader":
@@ -965,9 +1074,9 @@ class CmdSectionHeader(MainCmd):
         :raises SPSDKError: Raised when FORMAT is bigger than length of the data without offset
         :return: CmdSectionHeader
         """
-        if calcsize(cls.FORMAT) > len(data) - offset:
+        if cls.SIZE > len(data) - offset:
             raise SPSDKError("FORMAT is bigger than length of the data without offset!")
-        section_uid, section_type, length, _ = unpack_from(cls.FORMAT, data, offset)
+        section_uid, section_type, length, _ = cls._STRUCT.unpack_from(data, offset)
         return cls(section_uid=section_uid, section_type=section_type, length=length)
 
     # pylint: disable=redundant-returns-doc
@@ -1021,6 +1130,8 @@ CFG_NAME_TO_CLASS: Mapping[str, Type[BaseCmd]] = {
 ########################################################################################################################
 # Command parser from raw data
 ########################################################################################################################
+
+
 def parse_command(data: bytes, offset: int = 0) -> object:
     """Parse command from bytes array.
 
@@ -1031,10 +1142,10 @@ def parse_command(data: bytes, offset: int = 0) -> object:
     :return: object
     """
     #  verify that first 4 bytes of frame are 55aaaa55
-    tag = unpack_from("<L", data, offset=offset)[0]
+    tag, _, _, cmd_tag = BaseCmd._STRUCT.unpack_from(data, offset)
     if tag != BaseCmd.TAG:
         raise SPSDKError("Invalid tag.")
-    cmd_tag = unpack_from("<L", data, offset=offset + 12)[0]
-    if cmd_tag not in TAG_TO_CLASS:
+    cmd_class = TAG_TO_CLASS.get(cmd_tag)
+    if cmd_class is None:
         raise SPSDKError(f"Invalid command tag: {cmd_tag}")
-    return TAG_TO_CLASS[cmd_tag].parse(data, offset)
+    return cmd_class.parse(data, offset)
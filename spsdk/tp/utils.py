@@ -5,8 +5,9 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 """Trust Provisioning utilities."""
+import functools
 import os
-from typing import List, Optional, Type
+from typing import List, Optional, Tuple, Type
 
 from spsdk.crypto import ec
 from spsdk.exceptions import SPSDKError
@@ -15,6 +16,9 @@ from spsdk.utils.misc import load_configuration
 from . import TP_DATA_FOLDER, TpDevInterface, TpIntfDescription, TpTargetInterface
 from .adapters import TP_DEVICES, TP_TARGETS
 
+# ECC curves of the public keys by the length of a single coordinate
+_CURVES_BY_COORDINATE_LENGTH = {32: ec.SECP256R1(), 48: ec.SECP384R1()}
+
 
 def single_tp_device_adapter() -> bool:
     """Return True if there's only one TP device adapter."""
@@ -31,8 +35,14 @@ def get_supported_devices() -> List[str]:
 
     :return: List of devices.
     """
+    return list(_load_supported_devices())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_supported_devices() -> Tuple[str, ...]:
+    """Load names of supported devices from the database, the file is parsed just once."""
     data = load_configuration(os.path.join(TP_DATA_FOLDER, "database.yaml"))
-    return list(data["devices"].keys())
+    return tuple(data["devices"].keys())
 
 
 def get_tp_device_types() -> List[str]:
@@ -63,7 +73,7 @@ def scan_tp_devices(
 
 
 def get_tp_devices(
-    tpdev: Optional[str] = None, settings: Optional[dict] = None
+    tpdev: Optional[str] = None, settings: Optional[dict] = None, open_probe: bool = True
 ) -> List[TpDevInterface]:
     """Return a list of active TP Devices fulfilling criteria in 'settings'.
 
@@ -71,20 +81,23 @@ def get_tp_devices(
 
     :param tpdev: Name of TP Device interface, defaults to None
     :param settings: Settings for TP Target, defaults to None
+    :param open_probe: Check the device by opening and closing it, defaults to True
     :return: List of active TP Devices
     """
     device_descriptors = scan_tp_devices(tpdev=tpdev, settings=settings)
     devices = []
     for descriptor in device_descriptors:
+        dev = None
         try:
             dev = descriptor.create_interface()
             assert isinstance(dev, TpDevInterface)
-            dev.open()
-            dev.close()
+            if open_probe:
+                dev.open()
+                dev.close()
             devices.append(dev)
         except Exception:  # pylint: disable=broad-except   # the underlying error is unknown
-            dev.close()
-            continue
+            if dev is not None:
+                dev.close()
     return devices
 
 
@@ -116,7 +129,7 @@ def scan_tp_targets(
 
 
 def get_tp_targets(
-    tptarget: Optional[str] = None, settings: Optional[dict] = None
+    tptarget: Optional[str] = None, settings: Optional[dict] = None, open_probe: bool = True
 ) -> List[TpTargetInterface]:
     """Return a list of active TP Targets fulfilling criteria in 'settings'.
 
@@ -124,20 +137,23 @@ def get_tp_targets(
 
     :param tptarget: Name of TP Target interface, defaults to None
     :param settings: Settings for TP Target, defaults to None
+    :param open_probe: Check the target by opening and closing it, defaults to True
     :return: List is active TP Targets
     """
-    target_descriptors = scan_tp_devices(tpdev=tptarget, settings=settings)
+    target_descriptors = scan_tp_targets(tptarget=tptarget, settings=settings)
     targets = []
     for descriptor in target_descriptors:
+        target = None
         try:
             target = descriptor.create_interface()
             assert isinstance(target, TpTargetInterface)
-            target.open()
-            target.close()
+            if open_probe:
+                target.open()
+                target.close()
             targets.append(target)
         except Exception:  # pylint: disable=broad-except   # the underlying error is unknown
-            target.close()
-            continue
+            if target is not None:
+                target.close()
     return targets
 
 
@@ -162,9 +178,10 @@ def get_tp_target_class(name: str) -> Type[TpTargetInterface]:
 def reconstruct_cryptography_key(key_material: bytes) -> ec.EllipticCurvePublicKey:
     """Reconstruct cryptography's ECC Public Key from coordinates."""
     coordinate_length = len(key_material) // 2
-    curve = {32: ec.SECP256R1(), 48: ec.SECP384R1()}[coordinate_length]
-    point_x = int.from_bytes(key_material[:coordinate_length], byteorder="big")
-    point_y = int.from_bytes(key_material[coordinate_length:], byteorder="big")
+    curve = _CURVES_BY_COORDINATE_LENGTH[coordinate_length]
+    data = memoryview(key_material)
+    point_x = int.from_bytes(data[:coordinate_length], byteorder="big")
+    point_y = int.from_bytes(data[coordinate_length:], byteorder="big")
     pub_numbers = ec.EllipticCurvePublicNumbers(x=point_x, y=point_y, curve=curve)
     key = pub_numbers.public_key()
     return key
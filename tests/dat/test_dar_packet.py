@@ -14,7 +14,7 @@ import yaml
 
 from spsdk import SPSDKError
 from spsdk.dat import DebugAuthenticationChallenge as DAC
-from spsdk.dat.dar_packet import DebugAuthenticateResponse
+from spsdk.dat.dar_packet import DebugAuthenticateResponse, export_many
 from spsdk.dat.debug_credential import DebugCredential as DC
 from spsdk.utils.misc import load_binary, use_working_directory
 
@@ -95,3 +95,39 @@ def test_dar_packet_no_signature_provider(data_dir):
         dar.sig_provider = None
         with pytest.raises(SPSDKError, match="Signature provider is not set"):
             dar.export()
+
+
+def create_rsa_dars(data_dir, beacons):
+    """Create RSA DAR packets sharing one debug credential, one for each beacon."""
+    dac_bytes = load_binary(os.path.join(data_dir, "sample_dac.bin"))
+    with open(os.path.join(data_dir, "new_dck_rsa2048.yml"), "r") as f:
+        yaml_config = yaml.safe_load(f)
+    dc = DC.create_from_yaml_config(version="1.0", yaml_config=yaml_config)
+    dc.sign()
+    return [
+        DebugAuthenticateResponse.create(
+            version="1.0",
+            dc=dc,
+            auth_beacon=beacon,
+            dac=DAC.parse(dac_bytes),
+            dck=os.path.join(data_dir, "new_dck_2048.pem"),
+        )
+        for beacon in beacons
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_dar_packet_export_many(data_dir, max_workers):
+    with use_working_directory(data_dir):
+        dars = create_rsa_dars(data_dir, range(4))
+        # RSA PKCS#1 v1.5 signature is deterministic, so the results must match the serial export
+        assert export_many(dars, max_workers=max_workers) == [dar.export() for dar in dars]
+
+
+def test_dar_packet_export_after_change(data_dir):
+    with use_working_directory(data_dir):
+        dars = create_rsa_dars(data_dir, (0, 7))
+        dar_bytes = dars[0].export()
+        dars[0].auth_beacon = 7
+        assert dars[0].export() != dar_bytes
+        assert dars[0].export() == dars[1].export()
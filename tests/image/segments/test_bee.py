@@ -64,6 +64,11 @@ def test_bee_fac_region() -> None:
     # - address is not aligned
     with pytest.raises(SPSDKError, match="Invalid configuration of the instance"):
         BeeFacRegion(1, 1, 3)
+    # - only the address or only the length is not aligned
+    with pytest.raises(SPSDKError, match="Invalid configuration of the instance"):
+        BeeFacRegion(0x1100, 0x1000, 3)
+    with pytest.raises(SPSDKError, match="Invalid configuration of the instance"):
+        BeeFacRegion(0x1000, 0x1100, 3)
     # - length == 0
     with pytest.raises(SPSDKError, match="Invalid start/end address"):
         BeeFacRegion(0x2000, 0, 3)
@@ -156,6 +161,30 @@ def test_bee_region_header_fuses() -> None:
     assert fuses[3] == 0x11223344
 
 
+def test_bee_region_header_encrypt_image() -> None:
+    """Test BeeRegionHeader.encrypt_image() gives the same result as the encryption block by block"""
+    hdr = BeeRegionHeader(sw_key=crypto_backend().random_bytes(16))
+    hdr.add_fac(BeeFacRegion(0x60001000, 0x00002000, 0))
+    hdr.add_fac(BeeFacRegion(0x60004000, 0x00000800, 1))
+    image = crypto_backend().random_bytes(0x6000)
+    expected = b"".join(
+        hdr.encrypt_block(0x60000000 + offset, image[offset : offset + 0x400])
+        for offset in range(0, len(image), 0x400)
+    )
+    encrypted = bytearray(image)
+    hdr.encrypt_image(0x60000000, encrypted)
+    assert encrypted == expected
+    assert encrypted[:0x1000] == image[:0x1000]
+    assert encrypted[0x1000:0x3000] != image[0x1000:0x3000]
+    # CTR mode does not pad the data
+    assert len(hdr.encrypt_block(0x60001000, image[:0x10F])) == 0x10F
+    # image outside of the FAC regions is untouched
+    assert not hdr.is_overlapping(0x70000000, len(image))
+    untouched = bytearray(image)
+    hdr.encrypt_image(0x70000000, untouched)
+    assert untouched == image
+
+
 def test_seg_bee() -> None:
     """Test SegBEE class - BEE segment of the bootable image"""
     # empty segment
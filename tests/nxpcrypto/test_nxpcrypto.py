@@ -48,6 +48,7 @@ def test_nxpcrypto_key_verify(data_dir: str, key1: str, key2: str, expected_resu
         ("prk_secp256_d_3.pem", "-f raw", "prk_secp256_d_3.bin"),
         ("prk_secp256_d_3.bin", "-f pem --puk", "puk_secp256_d_3.pem"),
         ("puk_secp256_d_5.pem", "-f der", "puk_secp256_d_5.der"),
+        ("puk_secp256_d_5.pem", "-f raw", "puk_secp256_d_5.bin"),
     ],
 )
 def test_nxpcrypto_convert(data_dir: str, tmpdir: str, key: str, transform: str, expected: str):
@@ -72,3 +73,46 @@ def test_nxpcrypto_convert(data_dir: str, tmpdir: str, key: str, transform: str,
         # zip_longest ensures there will be an error if one file is longer
         for src_line, dst_line in zip_longest(src_lines, dst_lines):
             assert src_line == dst_line
+
+
+@pytest.mark.parametrize(
+    "hash_name, compare, expected_result",
+    [
+        ("sha256", None, 0),
+        ("sha256", "2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1dc", 0),
+        ("SHA256", "2DB9DDE21110DC9F1C8AEE68E7ADB48907460072E13742A05A2D71340958F1DC", 0),
+        ("sha256", "2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1dd", 1),
+        ("sha256", "2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1d", 1),
+        ("sha256", "not-a-digest", 1),
+    ],
+)
+def test_nxpcrypto_digest(data_dir: str, hash_name: str, compare: str, expected_result: int):
+    cmd = f"digest -h {hash_name} -i puk_secp256_d_5.bin"
+    if compare:
+        cmd += f" -c {compare}"
+    result = run_nxpcrypto(cmd, data_dir)
+    assert result.exit_code == expected_result
+    assert "2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1dc" in result.output
+
+
+@pytest.mark.parametrize(
+    "ref_file_content, expected_result",
+    [
+        (
+            "SHA256(puk_secp256_d_5.bin)= 2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1dc\n",
+            0,
+        ),
+        ("2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1dc\n", 0),
+        ("2db9dde21110dc9f1c8aee68e7adb48907460072e13742a05a2d71340958f1dc\r\nsecond line\r\n", 0),
+        ("0000000000000000000000000000000000000000000000000000000000000000\n", 1),
+    ],
+)
+def test_nxpcrypto_digest_compare_file(
+    data_dir: str, tmpdir: str, ref_file_content: str, expected_result: int
+):
+    ref_file = f"{tmpdir}/puk.sha256"
+    with open(ref_file, "w") as f:
+        f.write(ref_file_content)
+    cmd = f"digest -h sha256 -i puk_secp256_d_5.bin -c {ref_file}"
+    result = run_nxpcrypto(cmd, data_dir)
+    assert result.exit_code == expected_result
@@ -8,11 +8,13 @@
 """Test FCB part of nxpimage app."""
 import filecmp
 import os
+import random
 
 import pytest
 from click.testing import CliRunner
 
 from spsdk.apps import nxpimage
+from spsdk.image.fcb.fcb import FCB
 from spsdk.utils.misc import use_working_directory
 
 
@@ -85,3 +87,12 @@ def test_nxpimage_fcb_template_cli(tmpdir, family, mem_types):
     for mem_type in mem_types:
         template_name = os.path.join(tmpdir, f"fcb_{family}_{mem_type}.yaml")
         assert os.path.isfile(template_name)
+
+
+@pytest.mark.parametrize("family", ["rt5xx", "rt105x", "rt117x", "lpc55s3x"])
+def test_nxpimage_fcb_export_registers(family):
+    rng = random.Random(family)
+    fcb = FCB(family, "flexspi_nor")
+    for reg in fcb.registers.get_registers():
+        reg.set_value(rng.getrandbits(reg.width), raw=True)
+    assert fcb.export() == fcb.registers.image_info().export()
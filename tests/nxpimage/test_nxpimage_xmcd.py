@@ -8,6 +8,7 @@
 """Test FCB part of nxpimage app."""
 import filecmp
 import os
+import random
 
 import pytest
 import yaml
@@ -15,7 +16,7 @@ from click.testing import CliRunner
 
 from spsdk.apps import nxpimage
 from spsdk.image.xmcd.xmcd import XMCD
-from spsdk.utils.misc import use_working_directory
+from spsdk.utils.misc import load_binary, use_working_directory
 
 
 @pytest.mark.parametrize(
@@ -108,3 +109,33 @@ def test_nxpimage_xmcd_template_cli(tmpdir, data_dir, family):
             with open(ref_template_path) as f:
                 ref_template = yaml.safe_load(f)
             assert new_template == ref_template
+
+
+@pytest.mark.parametrize(
+    "family,mem_type,config_type,option",
+    [
+        ("rt117x", "semc_sdram", "full", None),
+        ("rt117x", "flexspi_ram", "simplified", 0),
+        ("rt116x", "flexspi_ram", "simplified", 1),
+        ("rt116x", "flexspi_ram", "full", None),
+    ],
+)
+def test_nxpimage_xmcd_export_registers(data_dir, family, mem_type, config_type, option):
+    rng = random.Random(f"{family}_{mem_type}_{config_type}_{option}")
+    xmcd = XMCD(family)
+    xmcd.mem_type = mem_type
+    xmcd.config_type = config_type
+    xmcd.registers = xmcd.load_registers(
+        family, mem_type, config_type, xmcd.revision, option_size=option
+    )
+    for reg in xmcd.registers.get_registers():
+        reg.set_value(rng.getrandbits(reg.width), raw=True)
+    assert xmcd.export() == xmcd.registers.image_info().export()
+
+    file_base_name = f"{mem_type}_{config_type}"
+    if option is not None:
+        file_base_name += f"_{option}"
+    binary = load_binary(os.path.join(data_dir, "xmcd", family, f"{file_base_name}.bin"))
+    xmcd = XMCD(family)
+    xmcd.parse(binary)
+    assert xmcd.export() == binary
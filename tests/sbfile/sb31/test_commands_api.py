@@ -6,6 +6,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Test of commands."""
 
+import struct
 
 import pytest
 
@@ -47,6 +48,29 @@ def test_cmd_erase():
     assert cmd == cmd_parsed
 
 
+def test_cmd_eq():
+    """Test comparison of commands, all attributes of the class hierarchy are compared."""
+    cmd = CmdCopy(address=1, length=2, destination_address=3, memory_id_from=4, memory_id_to=5)
+    assert cmd == CmdCopy(1, 2, 3, 4, 5)
+    assert cmd != CmdCopy(1, 2, 3, 4, 6)
+    assert cmd != CmdCopy(0, 2, 3, 4, 5)
+    assert CmdLoad(address=1, data=b"1") != CmdLoad(address=1, data=b"2")
+    assert CmdErase(address=1, length=2) != CmdFillMemory(address=1, length=2, pattern=0)
+
+
+def test_cmd_eq_subclass_without_slots():
+    """Test comparison of commands with attributes not declared in `__slots__`."""
+
+    class CmdCustom(BaseCmd):
+        def __init__(self, address: int, extra: str) -> None:
+            super().__init__(address=address, length=0, cmd_tag=EnumCmdTag.ERASE)
+            self.extra = extra
+
+    assert CmdCustom(1, "a") == CmdCustom(1, "a")
+    assert CmdCustom(1, "a") != CmdCustom(1, "b")
+    assert CmdCustom(1, "a") != CmdCustom(2, "a")
+
+
 def test_parse_invalid_cmd_erase_cmd_tag():
     """CmdErase tag validity test."""
     cmd = CmdErase(address=0, length=0, memory_id=0)
@@ -63,6 +87,14 @@ def test_parse_cmd_erase_invalid_padding():
         cmd.parse(data)
 
 
+@pytest.mark.parametrize("padding", [(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 1)])
+def test_parse_cmd_fillmemory_invalid_padding(padding):
+    data = bytearray(CmdFillMemory(address=100, length=0xFF, pattern=0x12).export())
+    data[20:32] = struct.pack("<3L", *padding)
+    with pytest.raises(SPSDKError, match="Invalid padding"):
+        CmdFillMemory.parse(data)
+
+
 def test_cmd_load():
     """Test address, len, memory_id, info value, size after append, export and parsing of CmdLoad command."""
     cmd = CmdLoad(address=100, data=bytes(range(10)), memory_id=1)
@@ -145,6 +177,15 @@ def test_program_cmd_progfuses():
     assert cmd == cmd_parsed
 
 
+def test_values_load_from_config():
+    """Test loading of 32-bit values of CmdLoad and CmdProgFuses from configuration."""
+    cmd = CmdLoad.load_from_config({"address": "0x100", "values": "0x12345678, 0xFFFFFFFF"})
+    assert cmd.data == bytes.fromhex("78563412FFFFFFFF")
+    cmd = CmdProgFuses.load_from_config({"address": "0x10", "values": "1,0x80000000"})
+    assert cmd.data == bytes.fromhex("0100000000000080")
+    assert cmd.length == 2
+
+
 def test_cmd_progifr():
     """Test address, data, info value, size after export and parsing of CmdProgIfr command."""
     cmd = CmdProgIfr(address=100, data=bytes([0] * 100))
@@ -287,6 +328,17 @@ def test_parse_invalid_cmd_loadkeyblob_cmd_tag():
         CmdErase.parse(data=data)
 
 
+def test_parse_cmd_loadkeyblob_short_data():
+    """CmdLoadKeyBlob with data shorter than the length in header."""
+    cmd = CmdLoadKeyBlob(
+        offset=100, key_wrap_id=CmdLoadKeyBlob._KeyWraps.NXP_CUST_KEK_EXT_SK.value, data=bytes(40)
+    )
+    data = cmd.export()
+    assert CmdLoadKeyBlob.parse(data) == cmd
+    with pytest.raises(SPSDKError, match="Invalid length of key blob data"):
+        CmdLoadKeyBlob.parse(data[:40])
+
+
 def test_cmd_configurememory():
     """Test address, memory_id, info value, size after export and parsing of CmdConfigureMemory command."""
     cmd = CmdConfigureMemory(address=100, memory_id=10)